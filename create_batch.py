@@ -3,10 +3,12 @@ import json
 
 client = OpenAI() # Make sure OPENAI_API_KEY is in env
 
-batch_input_file = client.files.create(
-    file=open("datasets/publication_dataset.jsonl", "rb"),
-    purpose="batch"
-)
+# Hand the SDK an open file handle to stream from, and close it once uploaded
+with open("datasets/publication_dataset.jsonl", "rb") as batch_file:
+    batch_input_file = client.files.create(
+        file=batch_file,
+        purpose="batch"
+    )
 
 print(batch_input_file)
 
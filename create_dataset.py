@@ -1,124 +1,378 @@
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import csv
 import json
+import orjson
 import time
+import functools
+import hashlib
+import sqlite3
+import threading
+import concurrent.futures
+from collections import deque, OrderedDict
 import tiktoken
 import pandas as pd
 import os
 from io import StringIO
-from xml.etree import ElementTree as ET
-
-def fetch_pmcid_from_pmid(pmid):
-    """Fetch PMCID from PMID using NCBI's ID Converter API"""
-    url = f"https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/?tool=my_tool&email=nf-osi@sagebionetworks.org&ids={pmid}&format=json"
-    response = requests.get(url)
-    if response.status_code == 200:
-        data = response.json()
-        records = data.get('records', [])
-        if records and 'pmcid' in records[0]:
-            return records[0]['pmcid']
-    return None
+from lxml import etree
+
+# NCBI allows 10 requests/second with an API key and 3 without one
+NCBI_API_KEY = os.environ.get("NCBI_API_KEY")
+MAX_REQUESTS_PER_SECOND = 10 if NCBI_API_KEY else 3
+MAX_WORKERS = 8
+# Rows submitted ahead of the writer; bounds how many finished articles wait in memory
+MAX_IN_FLIGHT = 2 * MAX_WORKERS
+
+class RateLimiter:
+    """Thread-safe sliding-window limiter allowing at most `rate` calls per `period` seconds"""
+    def __init__(self, rate=MAX_REQUESTS_PER_SECOND, period=1.0):
+        self.rate = rate
+        self.period = period
+        self.lock = threading.Lock()
+        self.timestamps = deque(maxlen=rate)
+
+    def acquire(self):
+        """Block until another request can be made without exceeding the rate"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if len(self.timestamps) < self.rate or now - self.timestamps[0] >= self.period:
+                    self.timestamps.append(now)
+                    return
+                wait = self.period - (now - self.timestamps[0])
+            time.sleep(wait)
+
+# Shared by all worker threads so the limit is enforced globally
+limiter = RateLimiter()
+
+class RateLimitedRetry(Retry):
+    """urllib3 Retry whose retries also wait on the shared rate limiter"""
+    def sleep(self, response=None):
+        super().sleep(response)
+        limiter.acquire()
+
+# Reuse one keep-alive session for all NCBI requests; retries back off on 429/5xx
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=RateLimitedRetry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+REQUEST_TIMEOUT = (3.05, 30)
+
+def http_get(url, stream=False):
+    """GET a URL through the shared session, returning None on request failure"""
+    limiter.acquire()
+    # Send the API key, when set, as a query parameter on every NCBI request
+    params = {"api_key": NCBI_API_KEY} if NCBI_API_KEY else None
+    try:
+        response = SESSION.get(
+            url, params=params, timeout=REQUEST_TIMEOUT, headers={"Accept-Encoding": "gzip"}, stream=stream
+        )
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Request failed for {url}: {e}")
+        return None
+    return response
+
+# Articles at or above this many tokens are left out of the batch
+MAX_TOKENS = 200000
+# Stop parsing once the extracted passage text passes this many characters.
+# Article text averages ~4 characters per token, so allowing 16 means only
+# articles far beyond MAX_TOKENS reach it; anything near the limit is still
+# counted exactly with tiktoken.
+MAX_CHARS_PER_TOKEN = 16
+MAX_TEXT_CHARS = MAX_TOKENS * MAX_CHARS_PER_TOKEN
+# Safety net against runaway downloads only. Raw BioC XML carries markup, infons
+# and embedded table XML that are never extracted, so this is set far above the
+# size of any article that could fit under MAX_TOKENS.
+MAX_XML_BYTES = 100_000_000
+
+class ArticleTooLargeError(Exception):
+    """Raised when an article is abandoned for size before it is fully fetched and tokenized"""
+
+# Text nodes of a passage's own <text> child (not those of nested annotations),
+# evaluated in libxml2. smart_strings=False returns plain str results that hold no
+# reference to their parent element, so cleared passages can actually be freed.
+_PASSAGE_TEXT_XPATH = etree.XPath("text/text()", smart_strings=False)
+
+class TeeReader:
+    """File-like wrapper that copies every chunk read from `source` into `sink`,
+    raising ArticleTooLargeError once more than `max_bytes` have been read"""
+    def __init__(self, source, sink, max_bytes=MAX_XML_BYTES):
+        self.source = source
+        self.sink = sink
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+
+    def read(self, n=-1):
+        chunk = self.source.read(n)
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self.max_bytes:
+            raise ArticleTooLargeError(f"XML exceeds {self.max_bytes} bytes")
+        self.sink.write(chunk)
+        return chunk
+
+class NCBICache:
+    """On-disk SQLite cache of resolved PMCIDs and extracted article text.
+
+    Shared across worker threads; the database is opened on first use, and
+    writes are committed every `commit_every` inserts and on close().
+    """
+    def __init__(self, path="ncbi_cache.sqlite", commit_every=50):
+        self.path = path
+        self.lock = threading.Lock()
+        self.commit_every = commit_every
+        self.pending = 0
+        self.conn = None
+
+    def _connect(self):
+        # Caller must hold self.lock
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("CREATE TABLE IF NOT EXISTS pmid_pmcid (pmid TEXT PRIMARY KEY, pmcid TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS pmcid_text (pmcid TEXT PRIMARY KEY, text TEXT, fetched_at TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS pmcid_too_large (pmcid TEXT PRIMARY KEY, reason TEXT, fetched_at TEXT)")
+            self.conn.commit()
+        return self.conn
+
+    def _get(self, query, key):
+        with self.lock:
+            row = self._connect().execute(query, (key,)).fetchone()
+        return row[0] if row else None
+
+    def _put(self, query, params):
+        with self.lock:
+            self._connect().execute(query, params)
+            self.pending += 1
+            if self.pending >= self.commit_every:
+                self.conn.commit()
+                self.pending = 0
+
+    def get_pmcid(self, pmid):
+        return self._get("SELECT pmcid FROM pmid_pmcid WHERE pmid = ?", pmid)
+
+    def put_pmcid(self, pmid, pmcid):
+        self._put("INSERT OR REPLACE INTO pmid_pmcid (pmid, pmcid) VALUES (?, ?)", (pmid, pmcid))
+
+    def get_text(self, pmcid):
+        return self._get("SELECT text FROM pmcid_text WHERE pmcid = ?", pmcid)
+
+    def put_text(self, pmcid, text):
+        self._put(
+            "INSERT OR REPLACE INTO pmcid_text (pmcid, text, fetched_at) VALUES (?, ?, datetime('now'))",
+            (pmcid, text)
+        )
+
+    def get_too_large(self, pmcid):
+        return self._get("SELECT reason FROM pmcid_too_large WHERE pmcid = ?", pmcid)
+
+    def put_too_large(self, pmcid, reason):
+        self._put(
+            "INSERT OR REPLACE INTO pmcid_too_large (pmcid, reason, fetched_at) VALUES (?, ?, datetime('now'))",
+            (pmcid, reason)
+        )
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.commit()
+                self.conn.close()
+                self.conn = None
+                self.pending = 0
+
+cache = NCBICache()
+
+# The ID Converter API accepts up to 200 comma-separated IDs per request
+IDCONV_BATCH_SIZE = 100
+
+def fetch_pmcids_bulk(pmids):
+    """Fetch PMCIDs for many PMIDs using NCBI's ID Converter API, batching IDs per request
+
+    Returns a dict mapping each PMID to its PMCID, or None if none was found.
+    """
+    pmcids = {}
+    missing = []
+    for pmid in pmids:
+        pmcids[pmid] = cache.get_pmcid(pmid)
+        if not pmcids[pmid]:
+            missing.append(pmid)
+    
+    for start in range(0, len(missing), IDCONV_BATCH_SIZE):
+        chunk = missing[start:start + IDCONV_BATCH_SIZE]
+        url = f"https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/?tool=my_tool&email=nf-osi@sagebionetworks.org&ids={','.join(chunk)}&format=json"
+        response = http_get(url)
+        if response is not None:
+            data = response.json()
+            for record in data.get('records', []):
+                pmid = str(record.get('pmid', record.get('requested-id')))
+                if pmid in pmcids and 'pmcid' in record:
+                    pmcids[pmid] = record['pmcid']
+                    cache.put_pmcid(pmid, record['pmcid'])
+    return pmcids
 
 def fetch_article_text(pmcid):
-    """Fetch article text content using PMC's BioC API and save XML to local folder"""
+    """Fetch article text content using PMC's BioC API and save XML to local folder
+
+    Raises ArticleTooLargeError, without finishing the download or tokenizing,
+    once the extracted text passes MAX_TEXT_CHARS (or the XML passes the
+    MAX_XML_BYTES safety net). Such articles are cached and not fetched again.
+    """
+    text_content = cache.get_text(pmcid)
+    if text_content:
+        return text_content
+    
+    too_large = cache.get_too_large(pmcid)
+    if too_large:
+        raise ArticleTooLargeError(too_large)
+    
     url = f"https://www.ncbi.nlm.nih.gov/research/bionlp/RESTful/pmcoa.cgi/BioC_xml/{pmcid}/unicode"
-    response = requests.get(url)
+    response = http_get(url, stream=True)
     
-    if response.status_code == 200:
+    if response is not None:
         # Create directory for XML files if it doesn't exist
         import os
         os.makedirs("xml_content", exist_ok=True)
         
-        # Save the XML content to a file
-        xml_file_path = f"xml_content/{pmcid}.xml"
-        with open(xml_file_path, "wb") as xml_file:
-            xml_file.write(response.content)
+        # Skip runaway downloads up front when the server reports an uncompressed size
+        content_length = response.headers.get("Content-Length")
+        if content_length and "Content-Encoding" not in response.headers and int(content_length) > MAX_XML_BYTES:
+            response.close()
+            e = ArticleTooLargeError(f"XML exceeds {MAX_XML_BYTES} bytes")
+            cache.put_too_large(pmcid, str(e))
+            raise e
         
+        # Save the XML to a file while parsing it, in a single pass over the stream
+        xml_file_path = f"xml_content/{pmcid}.xml"
+        # The body arrives gzipped (see http_get); have urllib3 decompress it as it
+        # is read so the file and the parser share one decompression pass
+        response.raw.decode_content = True
         try:
-            # Parse XML content
-            root = ET.fromstring(response.content)
-            # Extract all text passages
-            passages = root.findall(".//passage/text")
-            text_content = " ".join([p.text for p in passages if p.text])
-            return text_content
-        except ET.ParseError:
+            with response, open(xml_file_path, "wb") as xml_file:
+                # Stream-parse passages, discarding each one once its text is extracted
+                parts = []
+                text_chars = 0
+                tee = TeeReader(response.raw, xml_file)
+                for _, passage in etree.iterparse(tee, tag="passage"):
+                    for text in _PASSAGE_TEXT_XPATH(passage):
+                        parts.append(text)
+                        text_chars += len(text)
+                    if text_chars > MAX_TEXT_CHARS:
+                        raise ArticleTooLargeError(f"extracted text exceeds {MAX_TEXT_CHARS} characters")
+                    passage.clear()
+                    while passage.getprevious() is not None:
+                        del passage.getparent()[0]
+        except ArticleTooLargeError as e:
+            # Don't leave a truncated XML file behind, and don't fetch it again next run
+            os.remove(xml_file_path)
+            cache.put_too_large(pmcid, str(e))
+            raise
+        except (requests.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+            # The body is read while parsing, so timeouts, dropped connections and
+            # decode errors surface here rather than in http_get
+            print(f"Request failed for {url}: {e}")
+            if os.path.exists(xml_file_path):
+                os.remove(xml_file_path)
+            return None
+        except etree.XMLSyntaxError:
             print(f"XML parsing error for PMCID {pmcid}")
             return None
+        
+        text_content = " ".join(parts)
+        cache.put_text(pmcid, text_content)
+        return text_content
     return None
 
+# Detailed system prompt shared by every request in the batch, kept compact
+# (no blank lines or trailing spaces) since it is billed on every request
+SYSTEM_CONTENT = (
+    "You are an expert curation assistant who reviews biomedical publications to extract and classify key metadata attributes.\n"
+    "Your task is to:\n"
+    "1. Carefully read the publication content\n"
+    "2. Identify all relevant metadata elements defined in the schema\n"
+    "3. Select ONLY values from the provided controlled vocabularies in the schema\n"
+    "4. Format your response as valid JSON matching the required schema\n"
+    "5. For fields that allow multiple values, use comma-separated format if multiple values apply\n"
+    "6. If you're uncertain about a value, select the most appropriate option based on available evidence\n"
+    "Respond only with the completed JSON metadata, properly formatted according to the schema."
+)
+
+@functools.lru_cache(maxsize=4)
+def _get_encoding(model):
+    """Load (once per model) the tiktoken encoding"""
+    return tiktoken.encoding_for_model(model)
+
+# Token counts keyed by content hash, so identical text is only encoded once
+TOKEN_CACHE_SIZE = 10_000
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 def count_tokens(text, model="gpt-4"):
-    """Count tokens in text using tiktoken"""
-    encoding = tiktoken.encoding_for_model(model)
-    return len(encoding.encode(text))
+    """Count tokens in text using tiktoken, reusing counts for previously seen text"""
+    key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), model)
+    with _token_cache_lock:
+        if key in _token_cache:
+            _token_cache.move_to_end(key)
+            return _token_cache[key]
+    
+    token_count = len(_get_encoding(model).encode(text, disallowed_special=()))
+    with _token_cache_lock:
+        _token_cache[key] = token_count
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return token_count
 
-def main():
-    # Load CSV data
-    csv_file = "20250106_publicationsmanifestfinal.csv"
-    df = pd.read_csv(csv_file)
+SYSTEM_TOKENS = count_tokens(SYSTEM_CONTENT)
+
+# Manifest columns used to build each request, in the order process_row unpacks them
+ROW_COLUMNS = [
+    "Pubmed Id",
+    "Publication Title",
+    "Publication Journal",
+    "Publication Year",
+    "Publication Authors",
+    "Publication Abstract"
+]
+
+def process_row(row, pmcid, schema_str):
+    """Fetch and tokenize one publication whose PMCID has already been resolved.
+
+    Returns (pmid, pmcid, token_count, included, entry) where entry is the
+    JSONL request dict, or None if the publication was not included.
+    """
+    pmid, pub_title, pub_journal, pub_year, pub_authors, pub_abstract = row
+    print(f"Processing PMID: {pmid}")
     
-    # Load schema data
-    with open("pub_subschema.json", "r") as f:
-        schema = json.load(f)
+    if not pmcid:
+        print(f"No PMCID found for PMID {pmid}")
+        return pmid, None, 0, "Error-NoPMCID", None
     
-    # Filter for open access publications only
-    open_access_df = df[df["Publication Accessibility"] == "Open Access"]
+    print(f"Found PMCID: {pmcid}")
     
-    # Prepare JSON Lines output file
-    jsonl_output = "datasets/publication_dataset.jsonl"
+    # Fetch article text
+    try:
+        article_text = fetch_article_text(pmcid)
+    except ArticleTooLargeError as e:
+        # Not tokenized, so no token count is logged for it
+        print(f"Skipping PMID {pmid}: {e}")
+        return pmid, pmcid, 0, "Skipped-TooLarge", None
     
-    # Prepare log file for PMCIDs and token counts
-    log_file = "pmcid_token_log.csv"
+    if not article_text:
+        print(f"Failed to fetch article text for PMCID {pmcid}")
+        return pmid, pmcid, 0, "Error-NoText-or-XMLParseError", None
     
-    # Initialize log file with headers
-    with open(log_file, "w") as logfile:
-        logfile.write("PMID,PMCID,TokenCount,Included\n")
+    # Count tokens, including the constant system prompt
+    token_count = SYSTEM_TOKENS + count_tokens(article_text)
+    print(f"Token count: {token_count}")
     
-    with open(jsonl_output, "w") as outfile, open("pmcid_token_log.csv", "a") as logfile:
-        for i, row in open_access_df.iterrows():
-            pmid = str(row["Pubmed Id"])
-            print(f"Processing PMID: {pmid}")
-            
-            # Get PMCID from PMID
-            pmcid = fetch_pmcid_from_pmid(pmid)
-            
-            if pmcid:
-                print(f"Found PMCID: {pmcid}")
-                
-                # Fetch article text
-                article_text = fetch_article_text(pmcid)
-                
-                if article_text:
-                    # Count tokens
-                    token_count = count_tokens(article_text)
-                    print(f"Token count: {token_count}")
-                    
-                    included = "No"
-                    if token_count < 200000:
-                        # Create a more detailed system prompt
-                        system_content = """You are an expert curation assistant who reviews biomedical publications to extract and classify key metadata attributes. 
-
-Your task is to:
-1. Carefully read the publication content
-2. Identify all relevant metadata elements defined in the schema
-3. Select ONLY values from the provided controlled vocabularies in the schema
-4. Format your response as valid JSON matching the required schema
-5. For fields that allow multiple values, use comma-separated format if multiple values apply
-6. If you're uncertain about a value, select the most appropriate option based on available evidence
-
-Respond only with the completed JSON metadata, properly formatted according to the schema."""
-                        
-                        # Format schema and content for user message
-                        schema_str = json.dumps(schema)
-                        
-                        # Extract publication metadata from the row
-                        pub_title = row.get("Publication Title", "")
-                        pub_journal = row.get("Publication Journal", "")
-                        pub_year = str(row.get("Publication Year", ""))
-                        pub_authors = row.get("Publication Authors", "")
-                        pub_abstract = row.get("Publication Abstract", "")
-                        
-                        # Structure the user content in a more instructive way
-                        user_content = f"""# Publication Metadata Extraction Task
+    if token_count >= MAX_TOKENS:
+        print(f"Skipping PMID {pmid}: Too many tokens ({token_count})")
+        return pmid, pmcid, token_count, "No", None
+    
+    # Structure the user content in a more instructive way
+    user_content = f"""# Publication Metadata Extraction Task
 
 ## Instructions
 Please review the publication content and extract the following metadata according to the provided schema:
@@ -144,45 +398,108 @@ Please review the publication content and extract the following metadata accordi
 ## Full Publication Content
 {article_text}
 """
-                        
-                        # Create entry for JSONL file
-                        entry = {
-                            "custom_id": f"pub-{pmid}",
-                            "method": "POST",
-                            "url": "/v1/chat/completions",
-                            "body": {
-                                "model": "gpt-4o-mini",
-                                "messages": [
-                                    {
-                                        "role": "system",
-                                        "content": system_content
-                                    },
-                                    {
-                                        "role": "user",
-                                        "content": user_content
-                                    }
-                                ]
-                            }
-                        }
-                        
-                        # Write to JSON Lines file
-                        outfile.write(json.dumps(entry) + "\n")
-                        print(f"Added PMID {pmid} to dataset")
-                        included = "Yes"
-                    else:
-                        print(f"Skipping PMID {pmid}: Too many tokens ({token_count})")
-                    
-                    # Log PMCID and token count
-                    logfile.write(f"{pmid},{pmcid},{token_count},{included}\n")
-                else:
-                    print(f"Failed to fetch article text for PMCID {pmcid}")
-                    logfile.write(f"{pmid},{pmcid},0,Error-NoText-or-XMLParseError\n")
-            else:
-                print(f"No PMCID found for PMID {pmid}")
-                logfile.write(f"{pmid},None,0,Error-NoPMCID\n")
+    
+    # Create entry for JSONL file
+    entry = {
+        "custom_id": f"pub-{pmid}",
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SYSTEM_CONTENT
+                },
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ]
+        }
+    }
+    
+    return pmid, pmcid, token_count, "Yes", entry
+
+# Output buffering: 1 MiB write buffers, flushed every FLUSH_EVERY rows
+WRITE_BUFFER_SIZE = 1 << 20
+FLUSH_EVERY = 100
+
+def process_rows(executor, rows, pmcids, schema_str):
+    """Run process_row over rows on the executor, yielding results in input order.
+
+    At most MAX_IN_FLIGHT rows are submitted ahead of the consumer, so memory
+    stays bounded no matter how many rows there are.
+    """
+    pending = deque()
+    for row in rows:
+        pending.append(executor.submit(process_row, row, pmcids[row[0]], schema_str))
+        if len(pending) >= MAX_IN_FLIGHT:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def main():
+    # Load CSV data
+    csv_file = "20250106_publicationsmanifestfinal.csv"
+    # Only load the columns we use; wide manifests carry many more
+    df = pd.read_csv(
+        csv_file,
+        usecols=lambda column: column in ROW_COLUMNS or column == "Publication Accessibility",
+        dtype={"Publication Accessibility": "category"}
+    )
+    
+    # Load schema data
+    with open("pub_subschema.json", "r") as f:
+        schema = json.load(f)
+    
+    # Serialize the schema once for every user message, compactly to save tokens
+    schema_str = json.dumps(schema, separators=(",", ":"))
+    
+    # Filter for open access publications only, projecting to the columns used per row
+    # (missing metadata columns are filled with "" as row.get() used to do)
+    is_open_access = (df["Publication Accessibility"] == "Open Access").values
+    open_access_df = df.reindex(columns=ROW_COLUMNS, fill_value="").loc[is_open_access]
+    
+    # Prepare JSON Lines output file
+    jsonl_output = "datasets/publication_dataset.jsonl"
+    
+    # Prepare log file for PMCIDs and token counts
+    log_file = "pmcid_token_log.csv"
+    
+    try:
+        # Resolve all PMCIDs up front in batched ID Converter requests
+        rows = open_access_df.itertuples(index=False, name=None)
+        rows = [(str(row[0]),) + row[1:] for row in rows]
+        pmcids = fetch_pmcids_bulk([row[0] for row in rows])
+        
+        with open(jsonl_output, "wb", buffering=WRITE_BUFFER_SIZE) as outfile, \
+                open(log_file, "w", buffering=WRITE_BUFFER_SIZE) as logfile, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Initialize log file with headers
+            logfile.write("PMID,PMCID,TokenCount,Included\n")
+            
+            # Fetch in parallel; the shared limiter keeps us within NCBI's rate limit
+            results = process_rows(executor, rows, pmcids, schema_str)
             
-            # Add a small delay to avoid overloading the API
-            time.sleep(1)
+            # Drain results in input order so writes stay ordered and single-threaded
+            for i, (pmid, pmcid, token_count, included, entry) in enumerate(results, start=1):
+                if entry is not None:
+                    # Write to JSON Lines file (orjson output is compact, non-ASCII left unescaped)
+                    outfile.write(orjson.dumps(entry))
+                    outfile.write(b"\n")
+                    print(f"Added PMID {pmid} to dataset")
+                
+                # Log PMCID and token count
+                logfile.write(f"{pmid},{pmcid},{token_count},{included}\n")
+                
+                # Flush periodically so progress survives an interrupted run
+                if i % FLUSH_EVERY == 0:
+                    outfile.flush()
+                    logfile.flush()
+    finally:
+        # Commit any cache writes still pending, even if the run fails part way
+        cache.close()
 
 if __name__ == "__main__":
     main()
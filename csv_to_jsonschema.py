@@ -2,6 +2,45 @@ import pandas as pd
 import json
 import sys
 
+def _build_property(attribute, description, is_array, enum):
+    """
+    Build the JSON schema property definition for one attribute
+    
+    Args:
+        attribute (str): Attribute name
+        description (str): Attribute description
+        is_array (bool): Whether the field allows multiple values
+        enum (list or None): Valid values, if any
+        
+    Returns:
+        dict: JSON schema property definition
+    """
+    if is_array:
+        property_def = {
+            "type": "array",
+            "title": attribute,  # Original name with spaces
+            "description": description,
+            "items": {
+                "type": "string"
+            }
+        }
+        
+        # Add enum values if Valid Values exist
+        if enum is not None:
+            property_def["items"]["enum"] = enum
+    else:
+        property_def = {
+            "type": "string",
+            "title": attribute,  # Original name with spaces
+            "description": description
+        }
+        
+        # Add enum values if Valid Values exist
+        if enum is not None:
+            property_def["enum"] = enum
+    
+    return property_def
+
 def csv_to_json_schema(csv_file):
     """
     Convert publication CSV metadata specification to JSON schema
@@ -16,6 +55,10 @@ def csv_to_json_schema(csv_file):
     # Read the CSV file
     df = pd.read_csv(csv_file)
     
+    # Normalize Required to bool so booleans, "TRUE"/"true" strings and numeric 1/1.0
+    # are all recognized
+    df["Required"] = df["Required"].astype(str).str.strip().str.lower().isin(["true", "1", "1.0"])
+    
     # Filter the DataFrame to include only the target fields
     target_fields = [
         "Pubmed Id",
@@ -25,7 +68,7 @@ def csv_to_json_schema(csv_file):
         "Publication Dataset Alias"
     ]
     
-    filtered_df = df[df['Attribute'].isin(target_fields)]
+    filtered_df = df[df['Attribute'].isin(target_fields)].copy()
     
     # Create the JSON schema structure
     schema = {
@@ -37,49 +80,30 @@ def csv_to_json_schema(csv_file):
         "required": []
     }
     
-    # Populate the schema with filtered fields
-    for _, row in filtered_df.iterrows():
-        # Convert attribute name to camelCase for property keys (removing spaces)
-        property_key = row['Attribute'].replace(" ", "")
-        
-        # Check if the field allows multiple values (indicated by validation rule "list like")
-        is_array = row['Validation Rules'] == "list like"
-        
-        # Create property definition
-        if is_array:
-            property_def = {
-                "type": "array",
-                "title": row['Attribute'],  # Original name with spaces
-                "description": row['Description'],
-                "items": {
-                    "type": "string"
-                }
-            }
-            
-            # Add enum values if Valid Values exist
-            if pd.notna(row['Valid Values']) and row['Valid Values'] is not None:
-                # Handle comma-separated valid values
-                valid_values = [v.strip() for v in row['Valid Values'].split(',')]
-                property_def["items"]["enum"] = valid_values
-        else:
-            property_def = {
-                "type": "string",
-                "title": row['Attribute'],  # Original name with spaces
-                "description": row['Description']
-            }
-            
-            # Add enum values if Valid Values exist
-            if pd.notna(row['Valid Values']) and row['Valid Values'] is not None:
-                # Handle comma-separated valid values
-                valid_values = [v.strip() for v in row['Valid Values'].split(',')]
-                property_def["enum"] = valid_values
-        
-        # Add to properties
-        schema["properties"][property_key] = property_def
-        
-        # Add to required fields if required
-        if pd.notna(row['Required']) and row['Required'] == True:
-            schema["required"].append(property_key)
+    # Derive per-field helper columns with vectorized column operations
+    # Check if the field allows multiple values (indicated by validation rule "list like")
+    filtered_df["_is_array"] = filtered_df["Validation Rules"].eq("list like")
+    # Handle comma-separated valid values; fields without Valid Values get no enum
+    filtered_df["_enum"] = filtered_df["Valid Values"].astype("string").str.split(",").apply(
+        lambda values: [v.strip() for v in values] if isinstance(values, list) else None
+    )
+    # Convert attribute name to camelCase for property keys (removing spaces)
+    property_keys = filtered_df["Attribute"].str.replace(" ", "", regex=False)
+    
+    # Populate the schema with filtered fields, zipping the columns rather than building a Series per row
+    schema["properties"] = {
+        property_key: _build_property(attribute, description, is_array, enum)
+        for property_key, attribute, description, is_array, enum in zip(
+            property_keys,
+            filtered_df["Attribute"],
+            filtered_df["Description"],
+            filtered_df["_is_array"],
+            filtered_df["_enum"]
+        )
+    }
+    
+    # Add to required fields if required
+    schema["required"] = property_keys[filtered_df["Required"]].tolist()
     
     return schema
 